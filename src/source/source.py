@@ -7,6 +7,8 @@ Source :
     Class to represent a generic calibration radionuclide neutron source.
 Cf :
     Class to represent an example calibration radionuclide neutron source.
+Estimate :
+    Named tuple holding the value and relative standard uncertainty of a computed quantity.
 
 Data
 ----
@@ -22,13 +24,21 @@ standard_units : dict
     fluence-to-dose conversion factor in pSv·cm², total air scatter component in 1/cm, decay time in days,
     strength in 1/s, fluence rate in 1/cm²s and ambient dose equivalent rate in uSv/h.
 """
-from copy import copy
+import re
+from collections import namedtuple
 from datetime import datetime
-from math import exp, log, sqrt
+from functools import lru_cache
+from math import log
 from math import pi
 
+import numpy as np
 from magnitude import Magnitude
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 time_uncertainty_days = 1
 conversion_years_to_days = 365.242
 conversion_psv_s_to_usv_h = Magnitude(value=0.0036, unit='uSv·s/pSv/h', uncertainty=0)
@@ -41,6 +51,13 @@ standard_units = {
     'neutron_effectiveness': 'ND',
     'total_air_scatter_component': '1/cm'
 }
+_numeric_attributes = frozenset(standard_units)
+_ln2 = log(2)
+_inverse_4pi = 1 / (4 * pi)
+_psv_s_to_usv_h = conversion_psv_s_to_usv_h.value
+Estimate = namedtuple('Estimate', ['value', 'relative_uncertainty'])
+_SourceCore = namedtuple('_SourceCore', ['b0', 'ur_b0', 't12', 'ur_t12', 'fi', 'ur_fi', 'hf', 'ur_hf'])
+_date_pattern = re.compile(r'(\d{4})/(\d{2})/(\d{2})')
 
 
 class Source:
@@ -100,22 +117,41 @@ class Source:
     def __setattr__(self, name, value):
         """Check consistency when an attribute assignment is attempted."""
         self.__dict__[name] = value
-        if name in self.numeric_attributes():
+        if name in _numeric_attributes and value is not None:
             self.check_consistency(attr=name)
 
     def numeric_attributes(self):
         """Returns a dictionary mapping the attributes of a ``Source`` object of type Magnitude.
 
+        The attributes are those of ``standard_units``, in the same order.
+        Any other attribute of the ``Source`` object is not included.
+
         Returns
         -------
         attributes : dict
             Dictionary mapping the attributes of a Source object of type Magnitude
         """
-        attributes = {}
-        for attr, magnitude in self.__dict__.items():
-            if attr != 'name' and attr != 'calibration_date':
-                attributes[attr] = magnitude
-        return attributes
+        return {attr: self.__dict__.get(attr) for attr in standard_units}
+
+    def numeric_array(self):
+        """Returns the values and uncertainties of the attributes of a ``Source`` object of type Magnitude as an array.
+
+        Each row of the array corresponds to an attribute, in the order of ``standard_units``,
+        and holds its value, uncertainty and relative uncertainty.
+        Undefined attributes are filled with NaN.
+        The array is a snapshot: modifying it does not modify the source.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape (number of attributes, 3) and type float64.
+        """
+        array = np.full((len(standard_units), 3), np.nan)
+        for i, attr in enumerate(standard_units):
+            magnitude = self.__dict__.get(attr)
+            if magnitude is not None:
+                array[i] = magnitude.value, magnitude.uncertainty, magnitude.relative_uncertainty
+        return array
 
     def check_consistency(self, attr):
         """Check the consistency of an attributes of a ``Source`` object of type Magnitude in terms of physical meaning.
@@ -129,18 +165,19 @@ class Source:
             Name of the attribute of the ``Source`` object.
         """
 
-        # All numeric values and uncertainties must be positive
         # All units must be standard
+        # All numeric values and uncertainties must be positive
+        # Relative uncertainty is only checked for a non-zero uncertainty, otherwise it is zero
         magnitude = self.__dict__[attr]
         if magnitude is not None:
+            if magnitude.unit != standard_units[attr]:
+                raise ValueError(f'Source {attr} units must be standard.')
             if magnitude.value < 0:
                 raise ValueError(f'Source {attr} value must be positive.')
             if magnitude.uncertainty < 0:
                 raise ValueError(f'Source {attr} uncertainty must be positive.')
-            if magnitude.relative_uncertainty < 0:
+            if magnitude.uncertainty > 0 and magnitude.relative_uncertainty < 0:
                 raise ValueError(f'Source {attr} relative uncertainty must be positive.')
-            if magnitude.unit != standard_units[attr]:
-                raise ValueError(f'Source {attr} units must be standard.')
 
     def decay_time(self, date):
         """Compute the source's decay time on a ``date`` from the calibration date.
@@ -192,14 +229,71 @@ class Source:
             Source's decay factor on a ``date`` from the calibration date.
         """
         # TODO: compute decay factor value and uncertainty using Magnitudes
-        t12 = copy(self.half_life)
-        t12.value = t12.value * conversion_years_to_days
-        t = self.decay_time(date=date)
-        f = _decay_factor_value(t=t.value, t12=t12.value)
-        ur_f = _decay_factor_uncertainty(t=t.value, t12=t12.value,
-                                         ur_t=t.relative_uncertainty, ur_t12=t12.relative_uncertainty)
+        t12 = self.half_life.value * conversion_years_to_days
+        f, ur_f = _decay_factor_on_date(initial_date=self.calibration_date, final_date=date,
+                                        t12=t12, ur_t12=self.half_life.relative_uncertainty)
         return Magnitude(value=f, unit='ND', relative_uncertainty=ur_f)
 
+    def decay_factor_batch(self, dates):
+        """Compute the source's decay factor on several ``dates`` from the calibration date.
+
+        Vectorized counterpart of ``decay_factor``: the decay factor is computed on all the ``dates`` at once.
+        Values and relative standard uncertainties are returned as arrays in an ``Estimate``
+        instead of as ``Magnitude`` objects.
+        On the calibration date the decay factor is 1 without uncertainty.
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates on which decay factor is to be computed.
+
+        Returns
+        -------
+        Estimate
+            Arrays of values and relative standard uncertainties of the source's decay factor on the ``dates``
+            from the calibration date.
+        """
+        t, ur_t = self._decay_times(dates=dates)
+        t12 = self.half_life.value * conversion_years_to_days
+        return _decay_factor(t=t, t12=t12, ur_t=ur_t, ur_t12=self.half_life.relative_uncertainty)
+
+    def _core(self):
+        """Collect the values and relative uncertainties of the source's attributes used by the numeric kernels.
+
+        The half-life is converted to days.
+        The core is a snapshot: it is built on each call so that it never gets out of sync with the source.
+
+        Returns
+        -------
+        _SourceCore
+            Values and relative standard uncertainties of the source's attributes as plain floats.
+        """
+        b0 = self.calibration_strength
+        t12 = self.half_life
+        fi = self.anisotropy_factor
+        hf = self.fluence_to_dose_conversion_factor
+        return _SourceCore(b0=b0.value, ur_b0=b0.relative_uncertainty,
+                           t12=t12.value * conversion_years_to_days, ur_t12=t12.relative_uncertainty,
+                           fi=fi.value, ur_fi=fi.relative_uncertainty, hf=hf.value, ur_hf=hf.relative_uncertainty)
+
+    def _decay_times(self, dates):
+        """Compute the source's decay time on several ``dates`` from the calibration date.
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates on which decay time is to be computed.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Values and relative standard uncertainties of the source's decay time on the ``dates``
+            from the calibration date. On the calibration date the relative uncertainty is set to 0.
+        """
+        t = np.fromiter((_elapsed_time(initial_date=self.calibration_date, final_date=date) for date in dates),
+                        dtype=np.float64)
+        return t, _decay_time_relative_uncertainty(t)
+
     def strength(self, date):
         """Compute the source's strength on a ``date`` from the calibration date.
 
@@ -212,7 +306,8 @@ class Source:
         where :math:`B_0` is the source's strength on the source's calibration date and
         :math:`f` is the source's decay factor.
         Standard uncertainty and relative standard uncertainty are computed by uncertainty propagation.
-        If the specified date is the source's calibration date, return the source's calibration strength.
+        On the source's calibration date the decay factor is 1 without uncertainty,
+        so the strength equals the source's calibration strength.
 
         Parameters
         ----------
@@ -224,12 +319,72 @@ class Source:
         Magnitude
             Source's strength on a ``date`` from the calibration date.
         """
-        if date == self.calibration_date:
-            return self.calibration_strength
-        else:
-            b = self.calibration_strength * self.decay_factor(date=date)
-            b.unit = '1/s'
-            return b
+        b0 = self.calibration_strength
+        t12 = self.half_life
+        b, ur_b = _strength_on_date(initial_date=self.calibration_date, final_date=date,
+                                    b0=b0.value, ur_b0=b0.relative_uncertainty,
+                                    t12=t12.value * conversion_years_to_days, ur_t12=t12.relative_uncertainty)
+        return Magnitude(value=b, unit='1/s', relative_uncertainty=ur_b)
+
+    def strength_batch(self, dates):
+        """Compute the source's strength on several ``dates`` from the calibration date.
+
+        Vectorized counterpart of ``strength``: the strength is computed on all the ``dates`` at once.
+        Values and relative standard uncertainties are returned as arrays in an ``Estimate``
+        instead of as ``Magnitude`` objects.
+        Its relative standard uncertainty is computed as:
+
+        .. math::
+            u_r(B)=\\sqrt{u_r(B_0)^2+u_r(f)^2}
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates on which source strength is to be computed.
+
+        Returns
+        -------
+        Estimate
+            Arrays of values and relative standard uncertainties of the source's strength on the ``dates``
+            from the calibration date.
+        """
+        t, ur_t = self._decay_times(dates=dates)
+        t12 = self.half_life.value * conversion_years_to_days
+        return _strength(b0=self.calibration_strength.value, t=t, t12=t12,
+                         ur_b0=self.calibration_strength.relative_uncertainty, ur_t=ur_t,
+                         ur_t12=self.half_life.relative_uncertainty)
+
+    def strength_montecarlo(self, date, n=10000, seed=None):
+        """Compute the source's strength on a ``date`` from the calibration date by Monte Carlo simulation.
+
+        The calibration strength, the decay time and the half life are sampled from normal distributions
+        with their standard uncertainties, and the strength is computed for all the ``n`` samples at once.
+        The value and the standard uncertainty of the strength are the mean and the standard deviation of the samples.
+        This allows to check the analytic uncertainty propagation of ``strength``, which assumes linearity.
+
+        Parameters
+        ----------
+        date : str
+            Date on which source strength is to be computed.
+        n : int, optional
+            Number of samples. Default is 10000.
+        seed : int, optional
+            Seed of the random number generator, for reproducible results.
+
+        Returns
+        -------
+        Magnitude
+            Source's strength on a ``date`` from the calibration date.
+        """
+        rng = np.random.default_rng(seed)
+        b0 = self.calibration_strength
+        t12 = self.half_life
+        t = _elapsed_time(initial_date=self.calibration_date, final_date=date)
+        b0s = rng.normal(b0.value, b0.uncertainty, n)
+        ts = rng.normal(t, time_uncertainty_days, n)
+        t12s = rng.normal(t12.value, t12.uncertainty, n) * conversion_years_to_days
+        bs = b0s * _decay_factor_value(t=ts, t12=t12s)
+        return Magnitude(value=float(bs.mean()), unit='1/s', uncertainty=float(bs.std()))
 
     def fluence_rate(self, date, distance):
         """Compute the source's fluence rate on a ``date`` from the calibration date at a ``distance`` from the source.
@@ -246,7 +401,7 @@ class Source:
         Its relative standard uncertainty is computed as:
 
         .. math::
-            u_r(\\varphi)=\\sqrt{u_r(B)^2+u_r(f_I)^2+u_r(l)^2}
+            u_r(\\varphi)=\\sqrt{u_r(B)^2+u_r(f_I)^2+2u_r(l)^2}
 
         Parameters
         ----------
@@ -262,11 +417,40 @@ class Source:
         """
         b = self.strength(date=date)
         fi = self.anisotropy_factor
-        _pi = Magnitude(value=pi, unit='ND', uncertainty=0)
-        _4 = Magnitude(value=4, unit='ND', uncertainty=0)
-        f = b * fi / _4 / _pi / distance / distance
-        f.unit = '1/cm²s'
-        return f
+        f, ur_f = _fluence_rate(b=b.value, fi=fi.value, l=distance.value, ur_b=b.relative_uncertainty,
+                                ur_fi=fi.relative_uncertainty, ur_l=distance.relative_uncertainty)
+        return Magnitude(value=float(f), unit='1/cm²s', relative_uncertainty=float(ur_f))
+
+    def fluence_rate_batch(self, dates, distances):
+        """Compute the source's fluence rate on several ``dates`` from the calibration date
+        at several ``distances`` from the source.
+
+        Vectorized counterpart of ``fluence_rate``: the fluence rate is computed for every combination
+        of the ``dates`` and ``distances`` at once.
+        Values and relative standard uncertainties are returned as arrays in an ``Estimate``
+        instead of as ``Magnitude`` objects.
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates on which source's fluence rate is to be computed.
+        distances : sequence of Magnitude
+            Distances at which source's fluence rate is to be computed.
+
+        Returns
+        -------
+        Estimate
+            Arrays of values and relative standard uncertainties of the source's fluence rate on the ``dates``
+            from the calibration date at the ``distances`` from the source,
+            of shape (number of dates, number of distances).
+        """
+        b, ur_b = self.strength_batch(dates=dates)
+        fi = self.anisotropy_factor
+        l = np.array([distance.value for distance in distances], dtype=np.float64)
+        ur_l = np.array([distance.relative_uncertainty for distance in distances], dtype=np.float64)
+        # Dates along the rows and distances along the columns
+        return _fluence_rate(b=b[:, None], fi=fi.value, l=l, ur_b=ur_b[:, None], ur_fi=fi.relative_uncertainty,
+                             ur_l=ur_l)
 
     def ambient_dose_equivalent_rate(self, date, distance):
         """Compute the source's ambient dose equivalent rate on a ``date`` from the calibration date
@@ -301,9 +485,38 @@ class Source:
         """
         hf = self.fluence_to_dose_conversion_factor
         f = self.fluence_rate(date=date, distance=distance)
-        h = hf * f * conversion_psv_s_to_usv_h
-        h.unit = 'uSv/h'
-        return h
+        h, ur_h = _ambient_dose_equivalent_rate(hf=hf.value, f=f.value, ur_hf=hf.relative_uncertainty,
+                                                ur_f=f.relative_uncertainty)
+        return Magnitude(value=float(h), unit='uSv/h', relative_uncertainty=float(ur_h))
+
+    def ambient_dose_equivalent_rate_batch(self, dates, distances):
+        """Compute the source's ambient dose equivalent rate on several ``dates`` from the calibration date
+        at several ``distances`` from the source.
+
+        Vectorized counterpart of ``ambient_dose_equivalent_rate``: the ambient dose equivalent rate is computed
+        for every combination of the ``dates`` and ``distances`` at once.
+        Values and relative standard uncertainties are returned as arrays in an ``Estimate``
+        instead of as ``Magnitude`` objects.
+
+        Parameters
+        ----------
+        dates : sequence of str
+            Dates on which source's ambient dose equivalent rate is to be computed.
+        distances : sequence of Magnitude
+            Distances at which source's ambient dose equivalent rate is to be computed.
+
+        Returns
+        -------
+        Estimate
+            Arrays of values and relative standard uncertainties of the source's ambient dose equivalent rate
+            on the ``dates`` from the calibration date at the ``distances`` from the source,
+            of shape (number of dates, number of distances).
+        """
+        t, ur_t = self._decay_times(dates=dates)
+        l = np.array([distance.value for distance in distances], dtype=np.float64)
+        ur_l = np.array([distance.relative_uncertainty for distance in distances], dtype=np.float64)
+        # Dates along the rows and distances along the columns
+        return _ambient_dose_equivalent_rate_core(core=self._core(), t=t[:, None], l=l, ur_t=ur_t[:, None], ur_l=ur_l)
 
 
 class Cf(Source):
@@ -352,9 +565,59 @@ class Cf(Source):
         self.total_air_scatter_component = Magnitude(value=0.00012, unit='1/cm', relative_uncertainty=0.15)
 
 
+def _jit(function):
+    """Compile a numeric function to machine code with numba, if numba is installed.
+
+    Compiled functions are cached on disk so that they are only compiled once.
+    If numba is not installed the function is returned unchanged.
+
+    Parameters
+    ----------
+    function : function
+        Numeric function to be compiled.
+
+    Returns
+    -------
+    function
+        Compiled function, or the original function if numba is not installed.
+    """
+    if njit is None:
+        return function
+    return njit(cache=True)(function)
+
+
+@lru_cache(maxsize=1024)
+def _date_ordinal(date):
+    """Parse a date in the format YYYY/MM/DD into its proleptic Gregorian ordinal.
+
+    Zero-padded dates are parsed with a precompiled pattern, which is much faster than ``datetime.strptime``.
+    Any other date is left to ``datetime.strptime``, which also reports malformed dates.
+    Results are cached, since the same dates (e.g. the calibration date) are parsed over and over.
+
+    Parameters
+    ----------
+    date : str
+        Date in the format YYYY/MM/DD.
+
+    Returns
+    -------
+    int
+        Ordinal of the date, where January 1 of year 1 has ordinal 1.
+    """
+    match = _date_pattern.fullmatch(date)
+    if match is None:
+        return datetime.strptime(date, '%Y/%m/%d').toordinal()
+    return datetime(int(match[1]), int(match[2]), int(match[3])).toordinal()
+
+
+@lru_cache(maxsize=1024)
 def _elapsed_time(initial_date, final_date):
     """Compute the elapsed time between two dates in days.
 
+    Results are cached, since the same pair of dates is usually queried several times
+    (e.g. by ``Source.decay_time``, ``Source.decay_factor`` and ``Source.strength`` on the same date,
+    or by the batched methods over repeated dates).
+
     Parameters
     ----------
     initial_date : str
@@ -367,13 +630,31 @@ def _elapsed_time(initial_date, final_date):
     float
         Elapsed time between two dates in days.
     """
-    initial_date = datetime.strptime(initial_date, '%Y/%m/%d')
-    final_date = datetime.strptime(final_date, '%Y/%m/%d')
-    t = final_date - initial_date
-    t = t.days
-    return t
+    return _date_ordinal(final_date) - _date_ordinal(initial_date)
+
+
+def _decay_time_relative_uncertainty(t):
+    """Compute the relative standard uncertainty of the source's decay time.
+
+    On the calibration date there is no decay, and the relative uncertainty is set to 0
+    instead of dividing by a zero decay time.
 
+    Parameters
+    ----------
+    t : int or float or numpy.ndarray
+        Value of source's decay time in days.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Relative standard uncertainty of source's decay time.
+    """
+    t = np.asarray(t, dtype=np.float64)
+    ur_t = np.divide(time_uncertainty_days, t, out=np.zeros_like(t), where=t != 0)
+    return ur_t if ur_t.ndim else float(ur_t)
 
+
+@_jit
 def _decay_factor_value(t, t12):
     """Compute the value of the source's decay factor on a date from the calibration date.
 
@@ -387,19 +668,21 @@ def _decay_factor_value(t, t12):
 
     Parameters
     ----------
-    t : int or float
+    t : int or float or numpy.ndarray
         Value of source's decay time.
-    t12 : int or float
+    t12 : int or float or numpy.ndarray
         Value of source's half life.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Value of source's decay factor on a date from the calibration date.
+        A scalar if all the inputs are scalars, an array broadcast from the inputs otherwise.
     """
-    return exp(-log(2) * t / t12)
+    return np.exp(-_ln2 * t / t12)
 
 
+@_jit
 def _decay_factor_uncertainty(t, t12, ur_t, ur_t12):
     """Compute relative standard uncertainty of the source's decay factor on a date from the calibration date.
 
@@ -410,21 +693,229 @@ def _decay_factor_uncertainty(t, t12, ur_t, ur_t12):
 
     Parameters
     ----------
-    t : int or float
+    t : int or float or numpy.ndarray
         Value of source's decay time.
-    t12 : int or float
+    t12 : int or float or numpy.ndarray
         Value of source's half life.
-    ur_t : int or float
+    ur_t : int or float or numpy.ndarray
         Relative uncertainty of source's decay time.
-    ur_t12 : int or float
+    ur_t12 : int or float or numpy.ndarray
         Relative uncertainty of source's half life.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Relative standard uncertainty of source's decay factor on a date from the calibration date.
+        A scalar if all the inputs are scalars, an array broadcast from the inputs otherwise.
+    """
+    return _decay_factor(t, t12, ur_t, ur_t12).relative_uncertainty
+
+
+@_jit
+def _decay_factor(t, t12, ur_t, ur_t12):
+    """Compute the value and relative standard uncertainty of the source's decay factor on a date
+    from the calibration date.
+
+    Equivalent to ``_decay_factor_value`` and ``_decay_factor_uncertainty``,
+    but the exponent :math:`\\frac{\\ln(2)t}{t_{12}}` shared by both is only computed once.
+
+    Parameters
+    ----------
+    t : int or float or numpy.ndarray
+        Value of source's decay time.
+    t12 : int or float or numpy.ndarray
+        Value of source's half life.
+    ur_t : int or float or numpy.ndarray
+        Relative uncertainty of source's decay time.
+    ur_t12 : int or float or numpy.ndarray
+        Relative uncertainty of source's half life.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's decay factor on a date from the calibration date.
+    """
+    k = _ln2 * t / t12
+    return Estimate(np.exp(-k), np.sqrt(k ** 2 * (ur_t ** 2 + ur_t12 ** 2)))
+
+
+@_jit
+def _strength(b0, t, t12, ur_b0, ur_t, ur_t12):
+    """Compute the value and relative standard uncertainty of the source's strength on a date
+    from the calibration date.
+
+    The decay factor and the strength are computed in a single pass, so that no intermediate decay factor
+    arrays are kept when the inputs are arrays.
+
+    Parameters
+    ----------
+    b0 : int or float or numpy.ndarray
+        Value of source's calibration strength.
+    t : int or float or numpy.ndarray
+        Value of source's decay time.
+    t12 : int or float or numpy.ndarray
+        Value of source's half life.
+    ur_b0 : int or float or numpy.ndarray
+        Relative uncertainty of source's calibration strength.
+    ur_t : int or float or numpy.ndarray
+        Relative uncertainty of source's decay time.
+    ur_t12 : int or float or numpy.ndarray
+        Relative uncertainty of source's half life.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's strength on a date from the calibration date.
+    """
+    f, ur_f = _decay_factor(t, t12, ur_t, ur_t12)
+    return Estimate(b0 * f, np.hypot(ur_b0, ur_f))
+
+
+@_jit
+def _fluence_rate(b, fi, l, ur_b, ur_fi, ur_l):
+    """Compute the value and relative standard uncertainty of the source's fluence rate on a date
+    from the calibration date at a distance from the source.
+
+    Uncertainties are propagated as in ``Source.fluence_rate``, where the distance enters the computation twice.
+
+    Parameters
+    ----------
+    b : int or float or numpy.ndarray
+        Value of source's strength.
+    fi : int or float or numpy.ndarray
+        Value of source's anisotropy factor.
+    l : int or float or numpy.ndarray
+        Value of the distance from the source.
+    ur_b : int or float or numpy.ndarray
+        Relative uncertainty of source's strength.
+    ur_fi : int or float or numpy.ndarray
+        Relative uncertainty of source's anisotropy factor.
+    ur_l : int or float or numpy.ndarray
+        Relative uncertainty of the distance from the source.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's fluence rate.
+    """
+    return Estimate(b * fi * _inverse_4pi / l / l, np.sqrt(ur_b ** 2 + ur_fi ** 2 + ur_l ** 2 + ur_l ** 2))
+
+
+@_jit
+def _ambient_dose_equivalent_rate(hf, f, ur_hf, ur_f):
+    """Compute the value and relative standard uncertainty of the source's ambient dose equivalent rate
+    on a date from the calibration date at a distance from the source.
+
+    The value is converted from pSv/s to uSv/h.
+
+    Parameters
+    ----------
+    hf : int or float or numpy.ndarray
+        Value of source's fluence-to-dose conversion factor.
+    f : int or float or numpy.ndarray
+        Value of source's fluence rate.
+    ur_hf : int or float or numpy.ndarray
+        Relative uncertainty of source's fluence-to-dose conversion factor.
+    ur_f : int or float or numpy.ndarray
+        Relative uncertainty of source's fluence rate.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's ambient dose equivalent rate.
+    """
+    return Estimate(hf * f * _psv_s_to_usv_h, np.sqrt(ur_hf ** 2 + ur_f ** 2))
+
+
+@_jit
+def _ambient_dose_equivalent_rate_core(core, t, l, ur_t, ur_l):
+    """Compute the value and relative standard uncertainty of the source's ambient dose equivalent rate
+    from its numeric core, chaining the decay factor, strength, fluence rate and dose rate kernels.
+
+    Parameters
+    ----------
+    core : _SourceCore
+        Values and relative uncertainties of the source's attributes.
+    t : int or float or numpy.ndarray
+        Value of the decay time.
+    l : int or float or numpy.ndarray
+        Value of the distance from the source.
+    ur_t : int or float or numpy.ndarray
+        Relative uncertainty of the decay time.
+    ur_l : int or float or numpy.ndarray
+        Relative uncertainty of the distance from the source.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's ambient dose equivalent rate.
+    """
+    b, ur_b = _strength(b0=core.b0, t=t, t12=core.t12, ur_b0=core.ur_b0, ur_t=ur_t, ur_t12=core.ur_t12)
+    f, ur_f = _fluence_rate(b=b, fi=core.fi, l=l, ur_b=ur_b, ur_fi=core.ur_fi, ur_l=ur_l)
+    return _ambient_dose_equivalent_rate(hf=core.hf, f=f, ur_hf=core.ur_hf, ur_f=ur_f)
+
+
+@lru_cache(maxsize=1024)
+def _decay_factor_on_date(initial_date, final_date, t12, ur_t12):
+    """Compute the value and relative standard uncertainty of the source's decay factor on a date
+    from the calibration date.
+
+    Results are cached, since ``Source.decay_factor`` is usually queried several times on the same date.
+    The cache is keyed on plain values, so it never goes stale when the source's attributes are modified.
+    Values are returned as plain floats, whether the kernels are compiled or not.
+
+    Parameters
+    ----------
+    initial_date : str
+        Calibration date of the source.
+    final_date : str
+        Date on which decay factor is to be computed.
+    t12 : float
+        Value of source's half life in days.
+    ur_t12 : float
+        Relative uncertainty of source's half life.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's decay factor on ``final_date``.
+    """
+    t = _elapsed_time(initial_date=initial_date, final_date=final_date)
+    f, ur_f = _decay_factor(t=t, t12=t12, ur_t=_decay_time_relative_uncertainty(t), ur_t12=ur_t12)
+    return Estimate(float(f), float(ur_f))
+
+
+@lru_cache(maxsize=1024)
+def _strength_on_date(initial_date, final_date, b0, ur_b0, t12, ur_t12):
+    """Compute the value and relative standard uncertainty of the source's strength on a date
+    from the calibration date.
+
+    Results are cached like those of ``_decay_factor_on_date``, since ``Source.fluence_rate`` and
+    ``Source.ambient_dose_equivalent_rate`` query the strength on the same date several times.
+
+    Parameters
+    ----------
+    initial_date : str
+        Calibration date of the source.
+    final_date : str
+        Date on which strength is to be computed.
+    b0 : float
+        Value of source's calibration strength.
+    ur_b0 : float
+        Relative uncertainty of source's calibration strength.
+    t12 : float
+        Value of source's half life in days.
+    ur_t12 : float
+        Relative uncertainty of source's half life.
+
+    Returns
+    -------
+    Estimate
+        Value and relative standard uncertainty of source's strength on ``final_date``.
     """
-    return sqrt((log(2) * t / t12) ** 2 * (ur_t ** 2 + ur_t12 ** 2))
+    t = _elapsed_time(initial_date=initial_date, final_date=final_date)
+    b, ur_b = _strength(b0=b0, t=t, t12=t12, ur_b0=ur_b0, ur_t=_decay_time_relative_uncertainty(t), ur_t12=ur_t12)
+    return Estimate(float(b), float(ur_b))
 
 # TODO: BUG1 Magnitudes, representation, non-dimensional magnitudes, from '10 ± 1 ND (10%)' to '10 ± 1 (10%)'
 # TODO: Magnitudes: add parenthesis to units product and division.
@@ -0,0 +1,29 @@
+import pytest
+
+import src.source.source as ns
+
+
+@pytest.fixture(scope='session')
+def source():
+    # Shared by the tests that only read the source
+    return ns.Cf()
+
+
+@pytest.fixture
+def new_source():
+    # A fresh source for the tests that modify it
+    return ns.Cf()
+
+
+@pytest.fixture
+def without_numba(monkeypatch):
+    # Use the pure Python kernels, as when numba is not installed
+    for name in ('_decay_factor_value', '_decay_factor_uncertainty', '_decay_factor', '_strength', '_fluence_rate',
+                 '_ambient_dose_equivalent_rate', '_ambient_dose_equivalent_rate_core'):
+        kernel = getattr(ns, name)
+        monkeypatch.setattr(ns, name, getattr(kernel, 'py_func', kernel))
+    ns._decay_factor_on_date.cache_clear()
+    ns._strength_on_date.cache_clear()
+    yield
+    ns._decay_factor_on_date.cache_clear()
+    ns._strength_on_date.cache_clear()
@@ -1,12 +1,64 @@
+import numpy as np
 import pytest
 from magnitude import Magnitude
 
 import src.source.source as ns
 
 
-@pytest.fixture
-def source():
-    return ns.Cf()
+expected_attributes = {
+    'calibration_strength': (5.471E+08, 5.471E+08 * 0.013, 0.013),
+    'half_life': (2.6470, 0.0026, 0.0026 / 2.6470),
+    'anisotropy_factor': (1.051, 0.019, 0.019 / 1.051),
+    'linear_attenuation_coefficient': (1055e-7, 1055e-7 * 0.015, 0.015),
+    'fluence_to_dose_conversion_factor': (385, 385 * 0.01, 0.01),
+    'neutron_effectiveness': (0.5, 0.1, 0.1 / 0.5),
+    'total_air_scatter_component': (0.00012, 0.00012 * 0.15, 0.15),
+}
+
+
+invalid_mutations = [
+    pytest.param(lambda s: setattr(s, 'calibration_strength',
+                                   Magnitude(value=-5.471E+08, unit='1/s', relative_uncertainty=0.013)),
+                 'Source calibration strength must be positive.', id='magnitude_assignment_negative_value'),
+    pytest.param(lambda s: setattr(s, 'calibration_strength',
+                                   Magnitude(value=5.471E+08, unit='s', relative_uncertainty=0.013)),
+                 'Source calibration_strength units must be standard.', id='magnitude_assignment_non_standard_unit'),
+    pytest.param(lambda s: setattr(s, 'calibration_strength',
+                                   Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=-0.013)),
+                 'Uncertainties must be positive.', id='magnitude_assignment_negative_uncertainty'),
+    pytest.param(lambda s: setattr(s.calibration_strength, 'value', -5.471E+08),
+                 'Source calibration strength must be positive.', id='magnitude_attribute_assignment_negative_value'),
+    pytest.param(lambda s: setattr(s.calibration_strength, 'relative_uncertainty', -0.013),
+                 'Uncertainties must be positive.', id='magnitude_attribute_assignment_negative_uncertainty'),
+    pytest.param(lambda s: setattr(s.calibration_strength, 'units', 's'),
+                 'Source calibration_strength units must be standard.',
+                 id='magnitude_attribute_assignment_non_standard_unit'),
+]
+
+
+def _numerics(magnitude):
+    """Return the value, uncertainty and relative uncertainty of a magnitude."""
+    return magnitude.value, magnitude.uncertainty, magnitude.relative_uncertainty
+
+
+def _make_source(**overrides):
+    """Build a 252-Cf source attribute by attribute, as a subclass of Source would, replacing the given attributes."""
+    attributes = {
+        'name': '252-Cf',
+        'calibration_date': '2012/05/20',
+        'calibration_strength': Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=0.013),
+        'half_life': Magnitude(value=2.6470, unit='y', uncertainty=0.0026),
+        'anisotropy_factor': Magnitude(value=1.051, unit='ND', uncertainty=0.019),
+        'linear_attenuation_coefficient': Magnitude(value=1055e-7, unit='1/cm', relative_uncertainty=0.015),
+        'fluence_to_dose_conversion_factor': Magnitude(value=385, unit='pSv·cm²', relative_uncertainty=0.01),
+        'neutron_effectiveness': Magnitude(value=0.5, unit='ND', uncertainty=0.1),
+        'total_air_scatter_component': Magnitude(value=0.00012, unit='1/cm', relative_uncertainty=0.15),
+    }
+    attributes.update(overrides)
+    source = ns.Source()
+    for attr, value in attributes.items():
+        setattr(source, attr, value)
+    return source
 
 
 class TestSourceAttributesValue:
@@ -25,215 +77,169 @@ class TestSourceAttributesValue:
         actual = source.calibration_date
         assert actual == expected, f'Source calibration date should be {expected}, not {actual}.'
 
-    def test_source_calibration_strength(self, source):
-        expected = f'547100000.0 ± {5.471E+08 * 1.3 / 100} 1/s (1.3%)'
-        actual = str(source.calibration_strength)
-        assert actual == expected, f'Source calibration strength should be {expected}, not {actual}.'
-
-    def test_source_half_life(self, source):
-        expected = f'2.647 ± 0.0026 y ({0.0026 / 2.6470 * 100}%)'
-        actual = str(source.half_life)
-        assert actual == expected, f'Source half life should be {expected}, not {actual}.'
-
-    def test_source_anisotropy_factor(self, source):
-        expected = f'1.051 ± 0.019 ND ({0.019 / 1.051 * 100}%)'
-        actual = str(source.anisotropy_factor)
-        assert actual == expected, f'Source anisotropy factor should be {expected}, not {actual}.'
-
-    def test_source_linear_attenuation_coefficient(self, source):
-        expected = f'0.0001055 ± {1055e-7 * 1.5 / 100} 1/cm (1.5%)'
-        actual = str(source.linear_attenuation_coefficient)
-        assert actual == expected, f'Source linear attenuation coefficient should be {expected}, not {actual}.'
-
-    def test_source_fluence_to_dose_conversion_factor(self, source):
-        expected = f'385 ± {385 * 1 / 100} pSv·cm² (1.0%)'
-        actual = str(source.fluence_to_dose_conversion_factor)
-        assert actual == expected, f'Source fluence-to-dose conversion factor should be {expected}, not {actual}.'
-
-    def test_source_neutron_effectiveness(self, source):
-        expected = f'0.5 ± 0.1 ND ({0.1 / 0.5 * 100}%)'
-        actual = str(source.neutron_effectiveness)
-        assert actual == expected, f'Source neutron effectiveness should be {expected}, not {actual}.'
-
-    def test_source_total_air_scatter_component(self, source):
-        expected = f'0.00012 ± {0.00012 * 15 / 100} 1/cm (15.0%)'
-        actual = str(source.total_air_scatter_component)
-        assert actual == expected, f'Source total air scatter component should be {expected}, not {actual}.'
+    @pytest.mark.parametrize('attr, expected', expected_attributes.items())
+    def test_source_numeric_attribute(self, source, attr, expected):
+        actual = _numerics(getattr(source, attr))
+        assert actual == pytest.approx(expected, rel=1e-12), f'Source {attr} should be {expected}, not {actual}.'
 
 
 class TestSourceAttributesConsistency:
-    def test_all_values_positive(self, source):
-        attributes = source.numeric_attributes()
-        for attr, magnitude in attributes.items():
-            assert magnitude.value >= 0, f'Source {attr} value must be positive.'
-
-    def test_all_uncertainties_positive(self, source):
-        attributes = source.numeric_attributes()
-        for attr, magnitude in attributes.items():
-            assert magnitude.uncertainty >= 0, f'Source {attr} value must be positive.'
-
-    def test_all_relative_uncertainties_positive(self, source):
-        attributes = source.numeric_attributes()
-        for attr, magnitude in attributes.items():
-            assert magnitude.uncertainty >= 0, f'Source {attr} value must be positive.'
+    @pytest.mark.parametrize('attr', ns.standard_units)
+    def test_values_and_uncertainties_positive(self, source, attr):
+        magnitude = getattr(source, attr)
+        assert magnitude.value >= 0, f'Source {attr} value must be positive.'
+        assert magnitude.uncertainty >= 0, f'Source {attr} uncertainty must be positive.'
+        assert magnitude.relative_uncertainty >= 0, f'Source {attr} relative uncertainty must be positive.'
 
     def test_all_units_standard(self, source):
-        assert source.calibration_strength.unit == '1/s'
-        assert source.half_life.unit == 'y'
-        assert source.anisotropy_factor.unit == 'ND'
-        assert source.linear_attenuation_coefficient.unit == '1/cm'
-        assert source.fluence_to_dose_conversion_factor.unit == 'pSv·cm²'
-        assert source.neutron_effectiveness.unit == 'ND'
-        assert source.total_air_scatter_component.unit == '1/cm'
-
-    def test_class_assignment_negative_value(self):
-        with pytest.raises(ValueError) as exc:
-            class MySource(ns.Source):
-                def __init__(self):
-                    super().__init__()
-                    self.name = '252-Cf'
-                    self.calibration_date = '2012/05/20'
-                    self.calibration_strength = Magnitude(value=-5.471E+08, unit='1/s', relative_uncertainty=0.013)
-                    self.half_life = Magnitude(value=2.6470, unit='y', uncertainty=0.0026)
-                    self.anisotropy_factor = Magnitude(value=1.051, unit='ND', uncertainty=0.019)
-                    self.linear_attenuation_coefficient = Magnitude(value=1055e-7, unit='1/cm',
-                                                                    relative_uncertainty=0.015)
-                    self.fluence_to_dose_conversion_factor = Magnitude(value=385, unit='pSv·cm²',
-                                                                       relative_uncertainty=0.01)
-                    self.neutron_effectiveness = Magnitude(value=0.5, unit='ND', uncertainty=0.1)
-                    self.total_air_scatter_component = Magnitude(value=0.00012, unit='1/cm', relative_uncertainty=0.15)
-
-            MySource()
-        assert 'Source calibration strength must be positive.' in str(exc.value)
-
-    def test_class_assignment_negative_uncertainty(self):
-        with pytest.raises(ValueError) as exc:
-            class MySource(ns.Source):
-                def __init__(self):
-                    super().__init__()
-                    self.name = '252-Cf'
-                    self.calibration_date = '2012/05/20'
-                    self.calibration_strength = Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=-0.013)
-                    self.half_life = Magnitude(value=2.6470, unit='y', uncertainty=0.0026)
-                    self.anisotropy_factor = Magnitude(value=1.051, unit='ND', uncertainty=0.019)
-                    self.linear_attenuation_coefficient = Magnitude(value=1055e-7, unit='1/cm',
-                                                                    relative_uncertainty=0.015)
-                    self.fluence_to_dose_conversion_factor = Magnitude(value=385, unit='pSv·cm²',
-                                                                       relative_uncertainty=0.01)
-                    self.neutron_effectiveness = Magnitude(value=0.5, unit='ND', uncertainty=0.1)
-                    self.total_air_scatter_component = Magnitude(value=0.00012, unit='1/cm', relative_uncertainty=0.15)
-
-            MySource()
-        assert 'Uncertainties must be positive.' in str(exc.value)
-
-    def test_class_assignment_non_standard_unit(self):
-        with pytest.raises(ValueError) as exc:
-            class MySource(ns.Source):
-                def __init__(self):
-                    super().__init__()
-                    self.name = '252-Cf'
-                    self.calibration_date = '2012/05/20'
-                    self.calibration_strength = Magnitude(value=5.471E+08, unit='s', relative_uncertainty=0.013)
-                    self.half_life = Magnitude(value=2.6470, unit='y', uncertainty=0.0026)
-                    self.anisotropy_factor = Magnitude(value=1.051, unit='ND', uncertainty=0.019)
-                    self.linear_attenuation_coefficient = Magnitude(value=1055e-7, unit='1/cm',
-                                                                    relative_uncertainty=0.015)
-                    self.fluence_to_dose_conversion_factor = Magnitude(value=385, unit='pSv·cm²',
-                                                                       relative_uncertainty=0.01)
-                    self.neutron_effectiveness = Magnitude(value=0.5, unit='ND', uncertainty=0.1)
-                    self.total_air_scatter_component = Magnitude(value=0.00012, unit='1/cm', relative_uncertainty=0.15)
-
-            MySource()
-        assert 'Source calibration_strength units must be standard.' in str(exc.value)
-
-    def test_magnitude_assignment_negative_value(self, source):
-        with pytest.raises(ValueError) as exc:
-            source.calibration_strength = Magnitude(value=-5.471E+08, unit='1/s', relative_uncertainty=0.013)
-        assert 'Source calibration strength must be positive.' in str(exc.value)
-
-    def test_magnitude_assignment_non_standard_unit(self, source):
-        with pytest.raises(ValueError) as exc:
-            source.calibration_strength = Magnitude(value=5.471E+08, unit='s', relative_uncertainty=0.013)
-        assert 'Source calibration_strength units must be standard.' in str(exc.value)
-
-    def test_magnitude_assignment_negative_uncertainty(self, source):
-        with pytest.raises(ValueError) as exc:
-            source.calibration_strength = Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=-0.013)
-        assert 'Uncertainties must be positive.' in str(exc.value)
-
-    def test_magnitude_assignment_modified_value(self, source):
-        source.calibration_strength = Magnitude(value=5.471E+07, unit='1/s', relative_uncertainty=0.013)
-        expected = f'54710000.0 ± {5.471E+07 * 0.013} 1/s (1.3%)'
-        actual = str(source.calibration_strength)
-        assert actual == expected, f'Source calibration strength should be {expected}, not {actual}.'
-
-    def test_magnitude_assignment_modified_uncertainty(self, source):
-        source.calibration_strength = Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=0.02)
-        expected = f'547100000.0 ± {5.471E+08 * 0.02} 1/s (2.0%)'
-        actual = str(source.calibration_strength)
-        assert actual == expected, f'Source calibration strength should be {expected}, not {actual}.'
-
-    def test_magnitude_attribute_assignment_negative_value(self, source):
-        with pytest.raises(ValueError) as exc:
-            source.calibration_strength.value = -5.471E+08
-        assert 'Source calibration strength must be positive.' in str(exc.value)
-
-    def test_magnitude_attribute_assignment_negative_uncertainty(self, source):
+        expected = {
+            'calibration_strength': '1/s',
+            'half_life': 'y',
+            'anisotropy_factor': 'ND',
+            'linear_attenuation_coefficient': '1/cm',
+            'fluence_to_dose_conversion_factor': 'pSv·cm²',
+            'neutron_effectiveness': 'ND',
+            'total_air_scatter_component': '1/cm',
+        }
+        actual = {attr: magnitude.unit for attr, magnitude in source.numeric_attributes().items()}
+        assert actual == expected, f'Source units should be {expected}, not {actual}.'
+
+    def test_extra_attribute_not_numeric(self, new_source):
+        new_source.comment = 'reference source'
+        assert new_source.comment == 'reference source'
+        assert 'comment' not in new_source.numeric_attributes(), 'Extra attributes should not be numeric attributes.'
+
+    def test_numeric_array(self, source):
+        attributes = source.numeric_attributes()
+        expected = [[m.value, m.uncertainty, m.relative_uncertainty] for m in attributes.values()]
+        actual = source.numeric_array().tolist()
+        assert actual == expected, f'Source numeric array should be {expected}, not {actual}.'
+
+    @pytest.mark.parametrize('calibration_strength, message', [
+        (dict(value=-5.471E+08, unit='1/s', relative_uncertainty=0.013),
+         'Source calibration strength must be positive.'),
+        (dict(value=5.471E+08, unit='1/s', relative_uncertainty=-0.013),
+         'Uncertainties must be positive.'),
+        (dict(value=5.471E+08, unit='s', relative_uncertainty=0.013),
+         'Source calibration_strength units must be standard.'),
+    ])
+    def test_class_assignment_invalid_calibration_strength(self, calibration_strength, message):
         with pytest.raises(ValueError) as exc:
-            source.calibration_strength.relative_uncertainty = -0.013
-        assert 'Uncertainties must be positive.' in str(exc.value)
+            _make_source(calibration_strength=Magnitude(**calibration_strength))
+        assert message in str(exc.value)
 
-    def test_magnitude_attribute_assignment_non_standard_unit(self, source):
+    @pytest.mark.parametrize('mutation, message', invalid_mutations)
+    def test_invalid_mutation(self, new_source, mutation, message):
         with pytest.raises(ValueError) as exc:
-            source.calibration_strength.units = 's'
-        assert 'Source calibration_strength units must be standard.' in str(exc.value)
-
-    def test_magnitude_attribute_assignment_modified_value(self, source):
-        source.calibration_strength.value = 5.471E+07
-        expected = f'54710000.0 ± {5.471E+07 * 0.013} 1/s (1.3%)'
-        actual = str(source.calibration_strength)
-        assert actual == expected, f'Source calibration strength should be {expected}, not {actual}.'
-
-    def test_magnitude_attribute_assignment_modified_uncertainty(self, source):
-        source.calibration_strength.relative_uncertainty = 0.02
-        expected = f'547100000.0 ± {5.471E+08 * 0.02} 1/s (2.0%)'
-        actual = str(source.calibration_strength)
-        assert actual == expected, f'Source calibration strength should be {expected}, not {actual}.'
+            mutation(new_source)
+        assert message in str(exc.value)
+
+    def test_magnitude_assignment_modified_value(self, new_source):
+        new_source.calibration_strength = Magnitude(value=5.471E+07, unit='1/s', relative_uncertainty=0.013)
+        expected = (5.471E+07, 5.471E+07 * 0.013, 0.013)
+        actual = _numerics(new_source.calibration_strength)
+        assert actual == pytest.approx(expected, rel=1e-12), \
+            f'Source calibration strength should be {expected}, not {actual}.'
+
+    def test_magnitude_assignment_modified_uncertainty(self, new_source):
+        new_source.calibration_strength = Magnitude(value=5.471E+08, unit='1/s', relative_uncertainty=0.02)
+        expected = (5.471E+08, 5.471E+08 * 0.02, 0.02)
+        actual = _numerics(new_source.calibration_strength)
+        assert actual == pytest.approx(expected, rel=1e-12), \
+            f'Source calibration strength should be {expected}, not {actual}.'
+
+    def test_magnitude_attribute_assignment_modified_value(self, new_source):
+        new_source.calibration_strength.value = 5.471E+07
+        expected = (5.471E+07, 5.471E+07 * 0.013, 0.013)
+        actual = _numerics(new_source.calibration_strength)
+        assert actual == pytest.approx(expected, rel=1e-12), \
+            f'Source calibration strength should be {expected}, not {actual}.'
+
+    def test_magnitude_attribute_assignment_modified_uncertainty(self, new_source):
+        new_source.calibration_strength.relative_uncertainty = 0.02
+        expected = (5.471E+08, 5.471E+08 * 0.02, 0.02)
+        actual = _numerics(new_source.calibration_strength)
+        assert actual == pytest.approx(expected, rel=1e-12), \
+            f'Source calibration strength should be {expected}, not {actual}.'
 
 
 class TestSourceMethods:
     date = '2020/05/20'
     distance = Magnitude(value=100, unit='cm', uncertainty=1)
 
-    def test_decay_time(self, source):
-        expected = f'2922 ± 1 d ({1 / 2922 * 100}%)'
-        actual = str(source.decay_time(date=self.date))
-        assert actual == expected, f'Source decay time should be {expected}, not {actual}.'
-
-    def test_decay_factor(self, source):
-        expected = f'0.12307796649188105 ± 0.0002681946089174612 ND (0.21790627239129182%)'
-        actual = str(source.decay_factor(date=self.date))
-        assert actual == expected, f'Source decay factor should be {expected}, not {actual}.'
-
-    def test_source_strength(self, source):
-        expected = f'67335955.46770813 ± 887579.6306368469 1/s (1.3181362386140014%)'
-        actual = str(source.strength(date=self.date))
-        assert actual == expected, f'Source strength should be {expected}, not {actual}.'
+    @pytest.mark.parametrize('method, kwargs, expected, unit', [
+        ('decay_time', dict(date=date), (2922, 1, 1 / 2922), 'd'),
+        ('decay_factor', dict(date=date), (0.12307796649188105, 0.0002681946089174612, 0.0021790627239129182), 'ND'),
+        ('decay_factor', dict(date='2012/05/20'), (1.0, 0.0, 0.0), 'ND'),
+        ('strength', dict(date=date), (67335955.46770813, 887579.6306368469, 0.013181362386140014), '1/s'),
+        ('fluence_rate', dict(date=date, distance=distance),
+         (563.170475934353, 14.906082662095244, 0.026468153603692817), '1/cm²s'),
+        ('ambient_dose_equivalent_rate', dict(date=date, distance=distance),
+         (780.5542796450133, 22.085178231439247, 0.028294224767409286), 'uSv/h'),
+    ])
+    def test_method(self, source, method, kwargs, expected, unit):
+        result = getattr(source, method)(**kwargs)
+        actual = _numerics(result)
+        assert actual == pytest.approx(expected, rel=1e-12), f'Source {method} should be {expected}, not {actual}.'
+        assert result.unit == unit, f'Source {method} unit should be {unit}, not {result.unit}.'
+
+    def test_decay_factor_batch(self, source):
+        expected = [(0.12307796649188105, 0.0021790627239129182)] * 2
+        values, uncertainties = source.decay_factor_batch(dates=[self.date, self.date])
+        actual = list(zip(values, uncertainties))
+        assert actual == expected, f'Source decay factors should be {expected}, not {actual}.'
+
+    def test_decay_factor_batch_at_calibration_date(self, source):
+        expected = [(1.0, 0.0)]
+        values, uncertainties = source.decay_factor_batch(dates=[source.calibration_date])
+        actual = list(zip(values, uncertainties))
+        assert actual == expected, f'Source decay factors should be {expected}, not {actual}.'
+
+    @pytest.mark.parametrize('method, kwargs', [
+        ('decay_factor', dict(date=date)),
+        ('strength', dict(date=date)),
+        ('fluence_rate', dict(date=date, distance=distance)),
+        ('ambient_dose_equivalent_rate', dict(date=date, distance=distance)),
+    ])
+    def test_method_returns_floats_without_numba(self, source, without_numba, method, kwargs):
+        result = getattr(source, method)(**kwargs)
+        actual = (type(result.value), type(result.relative_uncertainty))
+        assert actual == (float, float), f'Source {method} should hold floats, not {actual}.'
 
     def test_source_strength_at_calibration_date(self, source):
-        expected = source.calibration_strength
-        actual = source.strength(date=source.calibration_date)
-        assert actual == expected, f'Source strength should be {expected}, not {actual}.'
-
-    def test_fluence_rate(self, source):
-        expected = f'563.170475934353 ± 14.906082662095244 1/cm²s (2.6468153603692817%)'
-        actual = str(source.fluence_rate(date=self.date, distance=self.distance))
-        assert actual == expected, f'Source fluence rate should be {expected}, not {actual}.'
-
-    def test_ambient_dose_equivalent_rate(self, source):
-        expected = f'780.5542796450133 ± 22.085178231439247 uSv/h (2.8294224767409286%)'
-        actual = str(source.ambient_dose_equivalent_rate(date=self.date, distance=self.distance))
-        assert actual == expected, f'Source fluence rate should be {expected}, not {actual}.'
+        expected = _numerics(source.calibration_strength)
+        actual = _numerics(source.strength(date=source.calibration_date))
+        assert actual == pytest.approx(expected, rel=1e-12), f'Source strength should be {expected}, not {actual}.'
+
+    def test_source_strength_batch(self, source):
+        expected = [(67335955.46770813, 0.013181362386140014), (5.471E+08, 0.013)]
+        values, uncertainties = source.strength_batch(dates=[self.date, source.calibration_date])
+        actual = list(zip(values, uncertainties))
+        assert actual == expected, f'Source strengths should be {expected}, not {actual}.'
+
+    def test_source_strength_montecarlo(self, source):
+        expected = source.strength(date=self.date)
+        actual = source.strength_montecarlo(date=self.date, n=100000, seed=0)
+        assert actual.value == pytest.approx(expected.value, rel=1e-3), \
+            f'Source strength should be {expected}, not {actual}.'
+        assert actual.relative_uncertainty == pytest.approx(expected.relative_uncertainty, rel=0.05), \
+            f'Source strength should be {expected}, not {actual}.'
+
+    @pytest.mark.parametrize('method', ['fluence_rate', 'ambient_dose_equivalent_rate'])
+    def test_batch_grid(self, source, method):
+        dates = [self.date, '2016/05/20', source.calibration_date]
+        distances = [self.distance, Magnitude(value=250, unit='cm', uncertainty=2)]
+        expected = []
+        for date in dates:
+            row = []
+            for distance in distances:
+                result = getattr(source, method)(date=date, distance=distance)
+                row.append((result.value, result.relative_uncertainty))
+            expected.append(row)
+        values, uncertainties = getattr(source, f'{method}_batch')(dates=dates, distances=distances)
+        actual = [list(zip(*row)) for row in zip(values, uncertainties)]
+        assert values.shape == (len(dates), len(distances)), f'Source {method} batch shape should be a grid.'
+        assert actual == expected, f'Source {method} batch should be {expected}, not {actual}.'
 
 
 class TestSourceFunctions:
@@ -242,16 +248,49 @@ class TestSourceFunctions:
         actual = ns._elapsed_time(initial_date='2012/05/20', final_date='2020/05/20')
         assert actual == expected, f'Elapsed time should be {expected}, not {actual}.'
 
+    def test_elapsed_time_not_padded_dates(self):
+        expected = 2922
+        actual = ns._elapsed_time(initial_date='2012/5/20', final_date='2020/05/20')
+        assert actual == expected, f'Elapsed time should be {expected}, not {actual}.'
+
+    def test_elapsed_time_malformed_date(self):
+        with pytest.raises(ValueError):
+            ns._elapsed_time(initial_date='2012-05-20', final_date='2020/05/20')
+
+    def test_decay_time_relative_uncertainty(self):
+        expected = [1 / 2922, 0.0]
+        actual = [ns._decay_time_relative_uncertainty(2922), ns._decay_time_relative_uncertainty(0)]
+        assert actual == expected, f'Decay time relative uncertainty should be {expected}, not {actual}.'
+        actual = ns._decay_time_relative_uncertainty(np.array([2922.0, 0.0])).tolist()
+        assert actual == expected, f'Decay time relative uncertainty should be {expected}, not {actual}.'
+
     def test_decay_factor_value(self):
         expected = 0.12307796649188105
         actual = ns._decay_factor_value(t=2922, t12=2.6470 * ns.conversion_years_to_days)
         assert actual == expected, f'Source decay factor value should be {expected}, not {actual}.'
 
+    def test_decay_factor_value_array(self):
+        expected = [1.0, 0.12307796649188105]
+        actual = ns._decay_factor_value(t=np.array([0, 2922]), t12=2.6470 * ns.conversion_years_to_days)
+        assert list(actual) == expected, f'Source decay factor values should be {expected}, not {actual}.'
+
     def test_decay_factor_uncertainty(self):
         expected = 0.0021790627239129182
         actual = ns._decay_factor_uncertainty(t=2922, t12=2.6470 * ns.conversion_years_to_days, ur_t=1 / 2922,
                                            ur_t12=0.0026 / 2.6470)
         assert actual == expected, f'Source decay factor relative uncertainty should be {expected}, not {actual}.'
 
+    def test_decay_factor(self):
+        expected = (0.12307796649188105, 0.0021790627239129182)
+        actual = ns._decay_factor(t=2922, t12=2.6470 * ns.conversion_years_to_days, ur_t=1 / 2922,
+                                  ur_t12=0.0026 / 2.6470)
+        assert actual == expected, f'Source decay factor value and uncertainty should be {expected}, not {actual}.'
+
+    def test_strength(self):
+        expected = (67335955.46770813, 0.013181362386140014)
+        actual = ns._strength(b0=5.471E+08, t=2922, t12=2.6470 * ns.conversion_years_to_days, ur_b0=0.013,
+                              ur_t=1 / 2922, ur_t12=0.0026 / 2.6470)
+        assert actual == expected, f'Source strength value and uncertainty should be {expected}, not {actual}.'
+
 # TODO: validate numbers
 # TODO: Script to automate tests expected values